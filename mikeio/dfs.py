@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Optional
 
 import warnings
@@ -18,29 +20,115 @@ from mikecore.eum import eumQuantity
 from mikecore.DfsFile import DfsSimpleType, TimeAxisType, DfsFile
 from mikecore.DfsFactory import DfsFactory
 
-def _write_dfs_data(*, dfs: DfsFile, ds: Dataset, n_spatial_dims: int) -> None:
+# approximate size of the float32 buffer the items are packed into when writing
+_WRITE_BLOCK_BYTES = 2**20
+
+
+def _pack_float32(values, out, nan_mask, deletevalue) -> np.ndarray:
+    """Copy values into the float32 buffer out, with NaN replaced by deletevalue"""
+    np.copyto(out, values, casting="unsafe")
+    np.copyto(out, deletevalue, where=np.isnan(out, out=nan_mask))
+    return out
+
+
+def _packed_rows(item_values, deletevalue):
+    """Yield the float32 data of all items as rows in file order
+
+    item_values is a list with a (time, space) array per item. The rows are
+    yielded time step by time step, item by item, with NaN replaced by
+    deletevalue; every row is contiguous and can be passed directly to
+    WriteItemTimeStepNext. The input is not modified.
+
+    Several time steps of all items are packed at a time into reusable buffers
+    of at most _WRITE_BLOCK_BYTES, so the per-step overhead does not dominate
+    for small grids. If a single time step of all items exceeds this size, one
+    item is packed at a time instead.
+
+    With more than one block, the next block is packed on a worker thread
+    while the caller writes the current one (NumPy and the native dfs write
+    both release the GIL). The writing itself stays on the calling thread.
+    """
+    n_items = len(item_values)
+    n_timesteps, n_values = item_values[0].shape
+    if n_timesteps == 0:
+        return
+    block = min(n_timesteps, _WRITE_BLOCK_BYTES // (4 * max(n_items * n_values, 1)))
+    if block > 0:
+        # (first step, number of steps, items) of each block
+        blocks = [
+            (start, min(block, n_timesteps - start), range(n_items))
+            for start in range(0, n_timesteps, block)
+        ]
+    else:
+        block = 1
+        blocks = [(i, 1, [k]) for i in range(n_timesteps) for k in range(n_items)]
+    width = len(blocks[0][2])
+
+    # one set of buffers is packed while the other is being written
+    buffers = [
+        (
+            np.empty((block, width, n_values), dtype=np.float32),
+            np.empty((block, n_values), dtype=bool),
+        )
+        for _ in range(min(2, len(blocks)))
+    ]
+
+    def pack(k):
+        start, n, items = blocks[k]
+        out, nan_mask = buffers[k % 2]
+        for j, item in enumerate(items):
+            _pack_float32(
+                item_values[item][start : start + n],
+                out[:n, j],
+                nan_mask[:n],
+                deletevalue,
+            )
+        return out[:n].reshape(-1, n_values)
+
+    if len(blocks) == 1:
+        yield from pack(0)
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(pack, 0)
+        for k in range(len(blocks)):
+            packed = future.result()
+            if k + 1 < len(blocks):
+                future = executor.submit(pack, k + 1)
+            yield from packed
+
+
+def _write_timesteps(
+    write_next, item_data, t_rel, deletevalue, show_progress=False
+) -> None:
+    """Write all time steps of all items with write_next (WriteItemTimeStepNext)
+
+    item_data is a list with an array per item, time first (if present);
+    t_rel holds the time of each step relative to the file start in seconds.
+    """
+    n_timesteps = len(t_rel)
+
+    # (time, space) view of each item, the rows are written in file order
+    item_values = [d.reshape(n_timesteps, -1) for d in item_data]
+
+    # mikecore has no multi-step write, so the bound single step write is
+    # called for every item-timestep
+    rows = _packed_rows(item_values, deletevalue)
+    for i in trange(n_timesteps, disable=not show_progress):
+        for darray in islice(rows, len(item_values)):
+            write_next(t_rel[i], darray)
 
-    deletevalue = dfs.FileInfo.DeleteValueFloat  # ds.deletevalue
-    has_no_time = "time" not in ds.dims
+
+def _write_dfs_data(*, dfs: DfsFile, ds: Dataset) -> None:
+
+    deletevalue = np.float32(dfs.FileInfo.DeleteValueFloat)  # ds.deletevalue
     if ds.is_equidistant:
         t_rel = np.zeros(ds.n_timesteps)
     else:
-        t_rel = (ds.time - ds.time[0]).total_seconds()
-    
-    for i in range(ds.n_timesteps):
-        for item in range(ds.n_items):
-
-            if has_no_time:
-                d = ds[item].values
-            else:
-                d = ds[item].values[i]
-            d = d.copy()  # to avoid modifying the input
-            d[np.isnan(d)] = deletevalue
-
-            d = d.reshape(ds.shape[-n_spatial_dims:])  # spatial axes
-            darray = d.flatten()
+        t_rel = (ds.time - ds.time[0]).total_seconds().to_numpy()
 
-            dfs.WriteItemTimeStepNext(t_rel[i], darray.astype(np.float32))
+    item_data = [da.to_numpy() for da in ds]
+    _write_timesteps(dfs.WriteItemTimeStepNext, item_data, t_rel, deletevalue)
 
     dfs.Close()
 
@@ -54,6 +142,7 @@ class _Dfs123(TimeSeries):
         self._projstr = None
         self._start_time = None
         self._end_time = None
+        self._time = None
         self._is_equidistant = True
         self._items = None
         self._builder = None
@@ -114,23 +203,27 @@ class _Dfs123(TimeSeries):
 
         t_seconds = np.zeros(len(time_steps))
 
-        for i, it in enumerate(tqdm(time_steps, disable=not self.show_progress)):
-            for item in range(n_items):
+        # compare in the file precision (float32) to avoid upcasting
+        deletevalue = np.float32(self.deletevalue)
+
+        # bind outside the loop, dfs item numbers are 1-based
+        read_item_timestep = self._dfs.ReadItemTimeStep
+        dfs_item_numbers = [item_number + 1 for item_number in item_numbers]
 
-                itemdata = self._dfs.ReadItemTimeStep(item_numbers[item] + 1, int(it))
+        # (time, space) view of each output array, regardless of ndim and
+        # whether the time axis is kept, so every step is a flat row
+        item_rows = [values.reshape(nt, -1) for values in data_list]
 
-                src = itemdata.Data
-                d = src
+        for i, it in enumerate(tqdm(time_steps, disable=not self.show_progress)):
+            it = int(it)
+            for item_number, rows in zip(dfs_item_numbers, item_rows):
 
-                d[d == self.deletevalue] = np.nan
+                itemdata = read_item_timestep(item_number, it)
 
-                if self._ndim == 2:
-                    d = d.reshape(self._ny, self._nx)
+                d = itemdata.Data
+                d[d == deletevalue] = np.nan
 
-                if single_time_selected:
-                    data_list[item] = d
-                else:
-                    data_list[item][i] = d
+                np.copyto(rows[i], d, casting="unsafe")
 
             t_seconds[i] = itemdata.Time
 
@@ -139,12 +232,25 @@ class _Dfs123(TimeSeries):
         items = _get_item_info(self._dfs.ItemInfo, item_numbers)
 
         self._dfs.Close()
-        return Dataset(data_list, time, items, geometry=self.geometry, validate=False)
+
+        dims = ("z", "y", "x")[-self._ndim :]
+        if not (single_time_selected and not keepdims):
+            dims = ("time",) + dims
+
+        return Dataset(
+            data_list,
+            time=time,
+            items=items,
+            geometry=self.geometry,
+            dims=dims,
+            validate=False,
+        )
 
     def _read_header(self):
         dfs = self._dfs
         self._n_items = len(dfs.ItemInfo)
         self._items = self._get_item_info(list(range(self._n_items)))
+        self._time = None
         self._timeaxistype = dfs.FileInfo.TimeAxis.TimeAxisType
         if self._timeaxistype in {
             TimeAxisType.CalendarEquidistant,
@@ -187,7 +293,7 @@ class _Dfs123(TimeSeries):
             title=title, data=data, coordinate=coordinate, dt=dt
         )
 
-        shape = np.shape(data[0])
+        shape = data[0].shape
         t_offset = 0 if len(shape) == self._ndim else 1
         if self._ndim == 1:
             self._nx = shape[t_offset + 0]
@@ -202,16 +308,8 @@ class _Dfs123(TimeSeries):
         self._factory = DfsFactory()
         self._set_spatial_axis()
 
-        if self._ndim == 1:
-            if not all(np.shape(d)[t_offset + 0] == self._nx for d in self._data):
-                raise DataDimensionMismatch()
-
-        if self._ndim == 2:
-            if not all(np.shape(d)[t_offset + 0] == self._ny for d in self._data):
-                raise DataDimensionMismatch()
-
-            if not all(np.shape(d)[t_offset + 1] == self._nx for d in self._data):
-                raise DataDimensionMismatch()
+        if any(d.shape != shape for d in self._data):
+            raise DataDimensionMismatch()
 
         if neq_datetimes is not None:
             self._is_equidistant = False
@@ -221,21 +319,28 @@ class _Dfs123(TimeSeries):
         dfs = self._setup_header(filename)
         self._dfs = dfs
 
-        deletevalue = dfs.FileInfo.DeleteValueFloat  # -1.0000000031710769e-30
-
-        for i in trange(self._n_timesteps, disable=not self.show_progress):
-            for item in range(self._n_items):
+        # the time axis now describes the file being written
+        if self._is_equidistant:
+            self._timeaxistype = TimeAxisType.CalendarEquidistant
+            self._end_time = None
+        else:
+            self._timeaxistype = TimeAxisType.CalendarNonEquidistant
+            self._end_time = neq_datetimes[-1]
 
-                d = self._data[item][i] if t_offset == 1 else self._data[item]
-                d = d.copy()  # to avoid modifying the input
-                d[np.isnan(d)] = deletevalue
+        deletevalue = np.float32(dfs.FileInfo.DeleteValueFloat)
 
-                if self._is_equidistant:
-                    dfs.WriteItemTimeStepNext(0, d.astype(np.float32))
-                else:
-                    t = neq_datetimes[i]
-                    relt = (t - self._start_time).total_seconds()
-                    dfs.WriteItemTimeStepNext(relt, d.astype(np.float32))
+        if self._is_equidistant:
+            t_rel = np.zeros(self._n_timesteps)
+        else:
+            t_rel = (neq_datetimes - self._start_time).total_seconds().to_numpy()
+
+        _write_timesteps(
+            dfs.WriteItemTimeStepNext,
+            self._data,
+            t_rel,
+            deletevalue,
+            show_progress=self.show_progress,
+        )
 
         if not keep_open:
             dfs.Close()
@@ -250,28 +355,20 @@ class _Dfs123(TimeSeries):
         data: Dataset
         """
 
-        deletevalue = self._dfs.FileInfo.DeleteValueFloat  # -1.0000000031710769e-30
-
-        for i in trange(self._n_timesteps, disable=not self.show_progress):
-            for item in range(self._n_items):
-
-                d = data[item].to_numpy()[i]
-                d = d.copy()  # to avoid modifying the input
-                d[np.isnan(d)] = deletevalue
-
-                if self._ndim == 1:
-                    darray = d
+        if not self._is_equidistant:
+            raise NotImplementedError(
+                "Append is not yet available for non-equidistant files"
+            )
 
-                if self._ndim == 2:
-                    d = d.reshape(self.shape[1:])
-                    darray = d.reshape(d.size, 1)[:, 0]
+        deletevalue = np.float32(self._dfs.FileInfo.DeleteValueFloat)
 
-                if self._is_equidistant:
-                    self._dfs.WriteItemTimeStepNext(0, darray.astype(np.float32))
-                else:
-                    raise NotImplementedError(
-                        "Append is not yet available for non-equidistant files"
-                    )
+        _write_timesteps(
+            self._dfs.WriteItemTimeStepNext,
+            [da.to_numpy() for da in data],
+            np.zeros(data.n_timesteps),
+            deletevalue,
+            show_progress=self.show_progress,
+        )
 
     def __enter__(self):
         return self
@@ -288,6 +385,9 @@ class _Dfs123(TimeSeries):
         if title is None:
             self._title = ""
 
+        # time axis is replaced by the one being written
+        self._time = None
+
         self._n_timesteps = np.shape(data[0])[0]
         self._n_items = len(data)
 
@@ -319,7 +419,8 @@ class _Dfs123(TimeSeries):
             self._n_timesteps = len(data.time)
             if dt is None and len(data.time) > 1:
                 self._dt = (data.time[1] - data.time[0]).total_seconds()
-            self._data = data.to_numpy()
+            # per item arrays, stacking them with to_numpy() would copy the data
+            self._data = [da.to_numpy() for da in data]
         else:
             raise TypeError("data must be supplied in the form of a mikeio.Dataset")
 
@@ -465,7 +566,19 @@ class _Dfs123(TimeSeries):
     def end_time(self):
         """File end time"""
         if self._end_time is None:
-            self._end_time = self.read(items=[0]).time[-1].to_pydatetime()
+            if self._timeaxistype in {
+                TimeAxisType.CalendarEquidistant,
+                TimeAxisType.TimeEquidistant,
+            }:
+                self._end_time = self.start_time + timedelta(
+                    seconds=(self.n_timesteps - 1) * self.timestep
+                )
+            else:
+                # only read the time of the last time step
+                self._open()
+                itemdata = self._dfs.ReadItemTimeStep(1, self.n_timesteps - 1)
+                self._dfs.Close()
+                self._end_time = self.start_time + timedelta(seconds=itemdata.Time)
 
         return self._end_time
 
@@ -490,12 +603,10 @@ class _Dfs123(TimeSeries):
             TimeAxisType.CalendarEquidistant,
             TimeAxisType.TimeEquidistant,
         }:
-            return pd.to_datetime(
-                [
-                    self.start_time + timedelta(seconds=i * self.timestep)
-                    for i in range(self.n_timesteps)
-                ]
-            )
+            if self._time is None:
+                t_seconds = np.arange(self.n_timesteps) * self.timestep
+                self._time = pd.to_datetime(t_seconds, unit="s", origin=self.start_time)
+            return self._time
 
         else:
             return None
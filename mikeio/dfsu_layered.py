@@ -12,7 +12,7 @@ from .spatial.FM_geometry import GeometryFM3D
 from .custom_exceptions import InvalidGeometry
 from .dfsutil import _get_item_info, _valid_item_numbers, _valid_timesteps
 from .spatial.FM_utils import _plot_vertical_profile
-from .interpolation import get_idw_interpolant, interp2d
+from .interpolation import get_idw_interpolant
 from .eum import ItemInfo, EUMType
 
 
@@ -403,8 +403,8 @@ class Dfsu3D(DfsuLayered):
         geom = self.geometry.elements_to_geometry(top_el, node_layers="top")
         xye = geom.element_coordinates[:, 0:2]
         xyn = geom.node_coordinates[:, 0:2]
-        tree2d = cKDTree(xyn)
-        dist, node_ids = tree2d.query(xye, k=n_nearest)
+        tree2d = cKDTree(xyn, balanced_tree=False, compact_nodes=False)
+        dist, node_ids = tree2d.query(xye, k=n_nearest, workers=-1)
         if n_nearest == 1:
             weights = None
         else:
@@ -416,7 +416,11 @@ class Dfsu3D(DfsuLayered):
             top_el, node_layers="top"
         )
         zn_surf = ds[0]._zn[:, node_ids_surf]  # surface
-        surf2d = interp2d(zn_surf, node_ids, weights)
+        if weights is None:
+            surf2d = zn_surf[:, node_ids].astype(np.float64)
+        else:
+            # weighted sum over the n nearest nodes for all time steps at once
+            surf2d = np.einsum("tek,ek->te", zn_surf[:, node_ids], weights)
         surf_da = DataArray(
             data=surf2d,
             time=ds.time,
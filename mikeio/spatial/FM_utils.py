@@ -664,5 +664,7 @@ def _Get_2DVertical_elements(element_table):
     # if (type == DfsuFileType.DfsuVerticalProfileSigmaZ) or (
     #     type == DfsuFileType.DfsuVerticalProfileSigma
     # ):
-    elements = [list(element_table[i]) for i in range(len(list(element_table)))]
-    return np.asarray(elements)
+    # all elements in a vertical profile are quadrilaterals
+    if isinstance(element_table, np.ndarray) and element_table.dtype != object:
+        return element_table
+    return np.stack(element_table)
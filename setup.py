@@ -10,7 +10,7 @@ setuptools.setup(
         "mikecore>=0.2.1",
         "numpy>=1.15.0",  # first version with numpy.quantile
         "pandas>1.3",
-        "scipy>1.0",
+        "scipy>=1.6",  # cKDTree.query(workers=...)
         "PyYAML",
         "tqdm",
         "xarray",
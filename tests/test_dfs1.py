@@ -100,6 +100,20 @@ def test_read_time_steps():
     assert data.shape == (2, 3)  # time, x
 
 
+def test_read_single_time_step_keepdims_dtype():
+
+    filename = r"tests/testdata/random.dfs1"
+    dfs = mikeio.open(filename)
+
+    ds = dfs.read(time=3, keepdims=True)
+    assert ds.shape == (1, 3)  # time, x
+    assert ds.dims == ("time", "x")
+
+    ds = dfs.read(time=3, dtype=np.float64)
+    assert ds.shape == (3,)
+    assert ds[0].to_numpy().dtype == np.float64
+
+
 def test_write_some_time_steps_new_file(tmpdir):
 
     outfilename = os.path.join(tmpdir.dirname, "subset.dfs1")
@@ -119,6 +133,27 @@ def test_write_some_time_steps_new_file(tmpdir):
     assert dsnew["testing water level"].shape == (6, 3)
 
 
+def test_write_nan_roundtrip_input_unchanged(tmpdir):
+
+    outfilename = os.path.join(tmpdir.dirname, "nan.dfs1")
+
+    d = np.random.random((4, 3))
+    d[1, 2] = np.nan
+    da = mikeio.DataArray(
+        data=d,
+        time=pd.date_range("2012-1-1", freq="h", periods=4),
+        geometry=mikeio.Grid1D(nx=3, dx=1.0),
+    )
+    da.to_dfs(outfilename)
+
+    # the input data should not be modified by writing
+    assert np.isnan(d[1, 2])
+
+    dsnew = mikeio.read(outfilename)
+    assert np.array_equal(np.isnan(dsnew[0].to_numpy()), np.isnan(d))
+    assert np.allclose(dsnew[0].to_numpy()[0], d[0])
+
+
 def test_read_item_names_not_in_dataset_fails():
 
     filename = r"tests/testdata/random.dfs1"
@@ -176,6 +211,48 @@ def test_get_time_axis_without_reading_data_relative():
     assert len(dfs.time) == 200
 
 
+def test_time_axis_updated_after_write(tmpdir):
+
+    outfilename = os.path.join(tmpdir.dirname, "subset_time.dfs1")
+    dfs = mikeio.open("tests/testdata/random.dfs1")
+    ds = dfs.read()
+
+    assert len(dfs.time) == 100
+    assert dfs.end_time == ds.time[-1]
+
+    dssub = ds.isel(time=range(5, 8))
+    dfs.write(outfilename, dssub)
+
+    assert dfs.n_timesteps == 3
+    assert len(dfs.time) == 3
+    assert dfs.time[-1] == dssub.time[-1]
+    assert dfs.end_time == dssub.time[-1]
+
+
+def test_time_axis_updated_after_write_non_equidistant(tmpdir):
+
+    outfilename = os.path.join(tmpdir.dirname, "subset_neq.dfs1")
+    dfs = mikeio.open("tests/testdata/random.dfs1")
+    ds = dfs.read()
+
+    dsneq = ds.isel(time=[0, 2, 5, 6, 9])
+    dfs.write(outfilename, dsneq)
+
+    assert dfs.n_timesteps == 5
+    assert dfs.timestep is None
+    assert dfs.end_time == dsneq.time[-1]
+
+    # write more non-equidistant steps than the source file has
+    outfilename2 = os.path.join(tmpdir.dirname, "subset_neq2.dfs1")
+    dfs = mikeio.open(outfilename)
+    dsneq2 = ds.isel(time=[1, 3, 4, 7, 8, 10, 12])
+    dfs.write(outfilename2, dsneq2)
+
+    assert dfs.n_timesteps == 7
+    assert dfs.end_time == dsneq2.time[-1]
+    assert mikeio.read(outfilename2).time[-1] == dfs.end_time
+
+
 def test_select_point_dfs1_to_dfs0(tmp_path):
 
     outfilename = tmp_path / "vu_tide_hourly_p0.dfs0"
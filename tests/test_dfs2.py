@@ -587,6 +587,67 @@ def test_write_accumulated_datatype(tmpdir):
     assert newdfs.items[0].data_value_type == 3
 
 
+def test_write_nan_roundtrip_input_unchanged(tmpdir):
+
+    filename = os.path.join(tmpdir.dirname, "nan.dfs2")
+
+    d = np.random.random((3, 4, 5))
+    d[1, 2, 3] = np.nan
+    d[2, :, 0] = np.nan
+    da = mikeio.DataArray(
+        data=d,
+        time=pd.date_range("2012-1-1", freq="h", periods=3),
+        geometry=mikeio.Grid2D(nx=5, ny=4, dx=1, dy=1),
+    )
+    da.to_dfs(filename)
+
+    # the input data should not be modified by writing
+    assert np.isnan(da.values[1, 2, 3])
+    assert np.isnan(d[2, :, 0]).all()
+
+    dsnew = mikeio.read(filename)
+    assert np.array_equal(np.isnan(dsnew[0].values), np.isnan(d))
+    assert np.allclose(dsnew[0].values[0], d[0])
+
+
+@pytest.mark.parametrize(
+    "block_steps",
+    [
+        3,  # 3 time steps of both items at a time, the last block is a single step
+        0.5,  # a time step of both items exceeds the block, one item at a time
+    ],
+)
+def test_write_multiple_items_in_blocks(tmpdir, monkeypatch, block_steps):
+
+    filename = os.path.join(tmpdir.dirname, "blocks.dfs2")
+
+    nt, ny, nx = 10, 4, 5
+    n_items = 2
+    monkeypatch.setattr(
+        mikeio.dfs, "_WRITE_BLOCK_BYTES", int(4 * n_items * ny * nx * block_steps)
+    )
+
+    d1 = np.random.random((nt, ny, nx))
+    d1[4, 1, 2] = np.nan
+    d2 = np.random.random((nt, ny, nx))
+    d2[9] = np.nan
+    grid = mikeio.Grid2D(nx=nx, ny=ny, dx=1, dy=1)
+    time = pd.date_range("2012-1-1", freq="h", periods=nt)
+    ds = mikeio.Dataset(
+        [
+            mikeio.DataArray(data=d1, time=time, geometry=grid, item="Foo"),
+            mikeio.DataArray(data=d2, time=time, geometry=grid, item="Bar"),
+        ]
+    )
+
+    Dfs2().write(filename, ds)
+
+    dsnew = mikeio.read(filename)
+    for d, da in zip([d1, d2], dsnew):
+        assert np.array_equal(np.isnan(da.to_numpy()), np.isnan(d))
+        assert np.allclose(da.to_numpy()[~np.isnan(d)], d[~np.isnan(d)])
+
+
 def test_write_NonEqCalendarAxis(tmpdir):
 
     filename = os.path.join(tmpdir.dirname, "simple.dfs2")
@@ -616,6 +677,9 @@ def test_write_NonEqCalendarAxis(tmpdir):
     assert newds.start_time.year == 2012
     assert newds.end_time.day == 28
 
+    dfs = mikeio.open(filename)
+    assert dfs.end_time == newds.end_time
+
 
 def test_write_non_equidistant_data(tmpdir):
 
@@ -634,6 +698,7 @@ def test_write_non_equidistant_data(tmpdir):
     ds3 = dfs2.read()
 
     assert not ds3.is_equidistant
+    assert ds3.time.equals(ds.time)
 
 
 def test_incremental_write_from_dfs2(tmpdir):
@@ -688,6 +753,29 @@ def test_incremental_write_from_dfs2_context_manager(tmpdir):
     assert dfs.end_time == newdfs.end_time
 
 
+def test_append_more_time_steps_than_initial_write(tmpdir):
+
+    sourcefilename = "tests/testdata/eq.dfs2"
+    outfilename = os.path.join(tmpdir.dirname, "appended_blocks.dfs2")
+    dfs = mikeio.open(sourcefilename)
+    ds = dfs.read()
+
+    dfs_to_write = Dfs2()
+    dfs_to_write.write(
+        outfilename, ds.isel(time=range(2)), dt=dfs.timestep, keep_open=True
+    )
+    # appended datasets need not match the number of steps written initially
+    dfs_to_write.append(ds.isel(time=range(2, 7)))
+    dfs_to_write.append(ds.isel(time=[7]))
+    dfs_to_write.close()
+
+    dsnew = mikeio.read(outfilename)
+    assert dsnew.n_timesteps == 8
+    assert np.allclose(
+        dsnew[0].to_numpy(), ds.isel(time=range(8))[0].to_numpy(), equal_nan=True
+    )
+
+
 def test_read_concat_write_dfs2(tmp_path):
     outfilename = tmp_path / "waves_concat.dfs2"
 
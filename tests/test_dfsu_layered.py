@@ -590,6 +590,33 @@ def test_extract_surface_elevation_from_3d(tmpdir):
     assert dfs2.n_elements == n_top1
 
 
+@pytest.mark.parametrize("n_nearest", [1, 4])
+def test_extract_surface_elevation_from_3d_values(n_nearest):
+    from scipy.spatial import cKDTree
+    from mikeio.interpolation import get_idw_interpolant, interp2d
+
+    dfs = mikeio.open("tests/testdata/oresund_sigma_z.dfsu")
+
+    da = dfs.extract_surface_elevation_from_3d(n_nearest=n_nearest)
+
+    # reference: interpolate surface zn with the generic 2d interpolation
+    top_el = dfs.top_elements
+    geom = dfs.geometry.elements_to_geometry(top_el, node_layers="top")
+    xye = geom.element_coordinates[:, 0:2]
+    xyn = geom.node_coordinates[:, 0:2]
+    dist, node_ids = cKDTree(xyn).query(xye, k=n_nearest)
+    weights = None if n_nearest == 1 else get_idw_interpolant(dist)
+    ds = dfs.read(items=0, keepdims=True)
+    node_ids_surf, _ = dfs.geometry._get_nodes_and_table_for_elements(
+        top_el, node_layers="top"
+    )
+    zn_surf = ds[0]._zn[:, node_ids_surf]
+    expected = interp2d(zn_surf, node_ids, weights)
+
+    assert da.to_numpy().dtype == np.float64
+    assert np.allclose(da.to_numpy(), expected)
+
+
 def test_find_nearest_element_in_Zlayer():
     filename = os.path.join("tests", "testdata", "oresund_sigma_z.dfsu")
     dfs = mikeio.open(filename)